@@ -98,6 +98,9 @@ private:
     std::string expressionPath;  // Store path for lazy loading
     uint16_t frameWidth;   // Frame dimensions from Description.ini
     uint16_t frameHeight;
+    size_t packedFrameCount;  // FrameCount from Description.ini (0 = per-frame files)
+    size_t frameStride;       // FrameStride from Description.ini (bytes per frame in Frames.bin)
+    bool framesPacked;        // Frames are read from concatenated Frames/Frames.bin
     LoopType loopType;
     float animationFPS;
     uint32_t idleTimeMinMs;
@@ -127,6 +130,13 @@ private:
      */
     size_t validateFrames(const char* framesDir);
 
+    /**
+     * @brief Validate concatenated Frames.bin holds FrameCount frames
+     * @param framesDir Path to Frames directory
+     * @return Number of valid frames (0 if file missing or too short)
+     */
+    size_t validatePackedFrames(const char* framesDir);
+
     /**
      * @brief Load specific frame on-demand (lazy loading)
      * @param frameIndex Frame index to load
@@ -16,6 +16,8 @@ namespace Graphics {
  * 
  * Frame dimensions are stored in Expression's Description.ini to reduce file size
  * and improve loading speed (read dimensions once, reuse for all frames).
+ * Frames of one expression may be concatenated in a single file with fixed stride,
+ * in that case frame is read from given offset.
  */
 class Frame {
 public:
@@ -35,9 +37,10 @@ public:
      * @param filePath Path to the frame binary file
      * @param width Frame width in pixels
      * @param height Frame height in pixels
+     * @param offset Byte offset of frame data in file (for concatenated frames file)
      * @return true if successful, false otherwise
      */
-    bool loadFromFile(const char* filePath, uint16_t width, uint16_t height);
+    bool loadFromFile(const char* filePath, uint16_t width, uint16_t height, long offset = 0);
 
     /**
      * @brief Get frame width
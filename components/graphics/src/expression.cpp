@@ -15,6 +15,7 @@ namespace Graphics {
 Expression::Expression()
     : currentFrameIndex(0), totalFrameCount(0), expressionPath(""),
       frameWidth(0), frameHeight(0),
+      packedFrameCount(0), frameStride(0), framesPacked(false),
       loopType(LoopType::IdleBlink), animationFPS(20.0f), 
       idleTimeMinMs(1000), idleTimeMaxMs(1000),
       animState(AnimationState::Idle), idleTimeRemainingMs(0),
@@ -35,6 +36,9 @@ bool Expression::loadFromDirectory(const char* path) {
     frames.clear();
     currentFrameIndex = 0;
     totalFrameCount = 0;
+    packedFrameCount = 0;
+    frameStride = 0;
+    framesPacked = false;
 
     // Parse Description.ini
     char iniPath[256];
@@ -45,9 +49,16 @@ bool Expression::loadFromDirectory(const char* path) {
     }
 
     // STEP 1: Validate all frame files exist upfront
+    // Prefer single concatenated Frames.bin, fall back to per-frame files
     char framesDir[256];
     snprintf(framesDir, sizeof(framesDir), "%s/Frames", path);
-    totalFrameCount = validateFrames(framesDir);
+    if (packedFrameCount > 0) {
+        totalFrameCount = validatePackedFrames(framesDir);
+        framesPacked = totalFrameCount > 0;
+    }
+    if (!framesPacked) {
+        totalFrameCount = validateFrames(framesDir);
+    }
     
     if (totalFrameCount == 0) {
         ESP_LOGE(TAG, "No valid frames found in: %s", framesDir);
@@ -155,6 +166,12 @@ bool Expression::parseDescriptionIni(const char* iniPath) {
         } else if (strcmp(key, "Height") == 0) {
             frameHeight = atoi(value);
             ESP_LOGI(TAG, "Frame height: %u px", frameHeight);
+        } else if (strcmp(key, "FrameCount") == 0) {
+            packedFrameCount = atoi(value);
+            ESP_LOGI(TAG, "Frame count: %zu", packedFrameCount);
+        } else if (strcmp(key, "FrameStride") == 0) {
+            frameStride = atoi(value);
+            ESP_LOGI(TAG, "Frame stride: %zu bytes", frameStride);
         }
     }
 
@@ -205,6 +222,41 @@ size_t Expression::validateFrames(const char* framesDir) {
     return frameCount;
 }
 
+size_t Expression::validatePackedFrames(const char* framesDir) {
+    // Concatenated frames: FrameCount frames of FrameStride bytes each
+    char framesPath[256];
+    snprintf(framesPath, sizeof(framesPath), "%s/Frames.bin", framesDir);
+
+    // Stride defaults to bitmap size if not provided
+    size_t bitmapSize = frameWidth * ((frameHeight + 7) / 8);
+    if (frameStride == 0) {
+        frameStride = bitmapSize;
+    }
+    if (bitmapSize == 0 || frameStride < bitmapSize) {
+        ESP_LOGW(TAG, "Invalid frame stride %zu for %ux%u frames", frameStride, frameWidth, frameHeight);
+        return 0;
+    }
+
+    FILE* file = fopen(framesPath, "rb");
+    if (!file) {
+        ESP_LOGW(TAG, "FrameCount set but %s not found, using per-frame files", framesPath);
+        return 0;
+    }
+
+    fseek(file, 0, SEEK_END);
+    long fileSize = ftell(file);
+    fclose(file);
+
+    if (fileSize < 0 || static_cast<size_t>(fileSize) < packedFrameCount * frameStride) {
+        ESP_LOGE(TAG, "%s too short: %ld bytes for %zu frames of %zu bytes",
+                 framesPath, fileSize, packedFrameCount, frameStride);
+        return 0;
+    }
+
+    ESP_LOGI(TAG, "Validated %zu packed frames successfully", packedFrameCount);
+    return packedFrameCount;
+}
+
 bool Expression::loadFrame(size_t frameIndex) {
     // LAZY LOADING: Load individual frame on-demand
     // Frames stay in memory once loaded (no unloading)
@@ -220,10 +272,16 @@ bool Expression::loadFrame(size_t frameIndex) {
         return true;  // Frame already in memory
     }
 
-    // Build frame path
+    // Build frame path, packed frames are read at frameIndex * frameStride
     char framePath[256];
-    snprintf(framePath, sizeof(framePath), "%s/Frames/Frame_%02zu.bin", 
-             expressionPath.c_str(), frameIndex);
+    long frameOffset = 0;
+    if (framesPacked) {
+        snprintf(framePath, sizeof(framePath), "%s/Frames/Frames.bin", expressionPath.c_str());
+        frameOffset = static_cast<long>(frameIndex * frameStride);
+    } else {
+        snprintf(framePath, sizeof(framePath), "%s/Frames/Frame_%02zu.bin", 
+                 expressionPath.c_str(), frameIndex);
+    }
 
     // Load frame from SD card
     // NOTE: fread() internally uses DMA at SDMMC peripheral level
@@ -239,7 +297,7 @@ bool Expression::loadFrame(size_t frameIndex) {
     //   - Total loading time per frame
     
     auto frame = std::make_unique<Frame>();
-    if (!frame->loadFromFile(framePath, frameWidth, frameHeight)) {
+    if (!frame->loadFromFile(framePath, frameWidth, frameHeight, frameOffset)) {
         ESP_LOGE(TAG, "Failed to load frame %zu from: %s", frameIndex, framePath);
         return false;
     }
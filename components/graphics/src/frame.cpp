@@ -51,7 +51,7 @@ void Frame::cleanup() {
     bitmapSize = 0;
 }
 
-bool Frame::loadFromFile(const char* filePath, uint16_t frameWidth, uint16_t frameHeight) {
+bool Frame::loadFromFile(const char* filePath, uint16_t frameWidth, uint16_t frameHeight, long offset) {
     cleanup();
 
     // Store provided dimensions
@@ -65,7 +65,15 @@ bool Frame::loadFromFile(const char* filePath, uint16_t frameWidth, uint16_t fra
         return false;
     }
 
-    ESP_LOGI(TAG, "Loading frame %s: %dx%d", filePath, width, height);
+    ESP_LOGI(TAG, "Loading frame %s @%ld: %dx%d", filePath, offset, width, height);
+
+    // Seek to frame data when frames are concatenated in one file
+    if (offset > 0 && fseek(file, offset, SEEK_SET) != 0) {
+        ESP_LOGE(TAG, "Failed to seek to offset %ld in: %s", offset, filePath);
+        fclose(file);
+        cleanup();
+        return false;
+    }
 
     // Calculate bitmap size
     // u8g2 format: 8 vertical pixels per byte, column-major order
@@ -0,0 +1,1191 @@
+"""
+Graphics structure generation for Bobot 2 Amethyst
+
+Implementation of generate_graphics_structure.py. Kept in an importable
+module so Python caches its bytecode, both for the script itself and for
+the conversion worker processes, which import it again on start.
+"""
+
+import os
+import sys
+import configparser
+import functools
+import hashlib
+import json
+import multiprocessing
+import subprocess
+import shutil
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Dict, Optional, Tuple
+
+try:
+    from PIL import Image, ImageChops
+except ImportError:
+    print("Warning: Pillow (PIL) not found. Installing...")
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "Pillow"])
+    from PIL import Image, ImageChops
+
+# Try to import numpy for vectorized bitmap packing
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Try to import numba for a compiled bitmap packer (requires numpy)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Try to import compiled bitmap packer (build with: cythonize -i devtools/_pack.pyx)
+try:
+    from _pack import pack_u8g2
+    PACK_EXTENSION_AVAILABLE = True
+except ImportError:
+    PACK_EXTENSION_AVAILABLE = False
+
+# Intermediate PNG frames are kept in RAM on systems with /dev/shm
+TEMP_FRAMES_ROOT = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+# Aseprite location found by a previous run
+ASEPRITE_PATH_CACHE = Path.home() / ".cache" / "bobot" / "aseprite_path"
+
+# All frames of an expression are concatenated into this file inside Frames/
+FRAMES_FILE_NAME = "Frames.bin"
+
+# Parsed [Libraries] section of graphics Description.ini, stored next to it
+LIBRARIES_CACHE_FILE_NAME = ".description.cache.json"
+
+# Expressions exported by Aseprite at the same time
+EXPORT_WORKERS = os.cpu_count() or 1
+
+# Modification times and sizes of the sources of exported frames, stored inside Frames/
+STAMP_FILE_NAME = ".stamp"
+
+# Expression prepared for export: (expression_dir, config, created, aseprite_files, source_hash, stamp)
+ExpressionJob = Tuple[Path, configparser.ConfigParser, bool, List[Path], str, str]
+
+# Aseprite script writing u8g2 frames directly, used instead of PNG export when present
+U8G2_EXPORT_SCRIPT = Path(__file__).resolve().parent / "export_u8g2.lua"
+
+# Default Description.ini of an expression, %s is the expression name
+DEFAULT_DESCRIPTION_TEMPLATE = """; Description for %s expression
+
+[Loop]
+; Supported Loop types:
+;
+; 1. IdleBlink(default) - Display first frame for random time in range
+;                           [IdleTimeMinMS, IdleTimeMaxMS] ms and after that
+;                           run animation with AnimationFPS fps.
+;                           After that switch frame to first and repeat.
+;
+; 2. Loop - Repeat animation from first frame to last with AnimationFPS fps.
+;           IdleTimeMinMS and IdleTimeMaxMS are unnecessary and will be ignored
+;           if presented
+;
+; 3. Image - Display only first frame. All fields except type are unnecessary 
+;             and will be ignored if presented
+
+; Type field must be first
+Type = IdleBlink
+AnimationFPS = 20
+IdleTimeMinMS = 1000
+IdleTimeMaxMS = 3000
+
+[Dimensions]
+; Frame dimensions in pixels (filled automatically during export)
+Width = 0
+Height = 0
+"""
+
+# White source pixels are lit on the display, set True to light black pixels instead
+INVERT_OUTPUT = False
+
+
+@functools.lru_cache(maxsize=None)
+def find_aseprite_executable() -> Optional[str]:
+    """
+    Find the aseprite executable.
+    
+    ASEPRITE_BIN environment variable takes precedence. Otherwise the
+    path found by a previous run is reused if it is still an executable
+    file. If there is none, aseprite is looked up in PATH and common
+    install locations without starting any candidate to verify it. The
+    result is cached for the rest of the run.
+    
+    Returns:
+        Path to aseprite executable
+    """
+    env_path = os.environ.get('ASEPRITE_BIN')
+    if env_path:
+        return env_path
+    
+    try:
+        cached_path = ASEPRITE_PATH_CACHE.read_text().strip()
+        if cached_path and os.path.isfile(cached_path) and os.access(cached_path, os.X_OK):
+            return cached_path
+    except OSError:
+        pass
+    
+    # PATH lookup first, then common install locations, checked without running them
+    found_path = shutil.which('aseprite')
+    if found_path is None:
+        possible_paths = [
+            '/usr/bin/aseprite',
+            '/usr/local/bin/aseprite',
+            'C:\\Program Files\\Aseprite\\Aseprite.exe',
+            'C:\\Program Files (x86)\\Aseprite\\Aseprite.exe',
+        ]
+        found_path = next((path for path in possible_paths
+                           if os.path.isfile(path) and os.access(path, os.X_OK)), None)
+    
+    if found_path is not None:
+        # Store path so next run doesn't have to search
+        try:
+            ASEPRITE_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            ASEPRITE_PATH_CACHE.write_text(found_path)
+        except OSError:
+            pass
+        return found_path
+    
+    print("Warning: Aseprite executable not found. Frame export will be skipped.")
+    return None
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def pack_u8g2_numba(arr):
+        """
+        Pack monochrome pixel array into u8g2 vertical bytes.
+        
+        Walks the array column by column directly, so unlike np.packbits
+        no transposed copy or row padding is needed.
+        
+        Args:
+            arr: 2D uint8 array (height x width), nonzero = pixel on
+            
+        Returns:
+            1D uint8 array with column-major vertical bytes
+        """
+        height, width = arr.shape
+        pages = (height + 7) // 8
+        out = np.empty(width * pages, np.uint8)
+        k = 0
+        for x in range(width):
+            for y_byte in range(pages):
+                byte_val = 0
+                for bit in range(8):
+                    y = y_byte * 8 + bit
+                    if y < height and arr[y, x]:
+                        byte_val |= 1 << bit
+                out[k] = byte_val
+                k += 1
+        return out
+
+
+def scan_files(directory: Path, suffixes: Tuple[str, ...], prefix: str = "") -> List[Path]:
+    """
+    List files in a directory by name prefix and suffix in one pass.
+    
+    Uses os.scandir, so file type comes from the directory listing
+    without an extra stat per entry. Hidden files are skipped like glob does.
+    
+    Args:
+        directory: Directory to scan
+        suffixes: Accepted file name suffixes
+        prefix: Required file name prefix
+        
+    Returns:
+        Matching file paths, empty if directory doesn't exist
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return [Path(entry.path) for entry in entries
+                    if not entry.name.startswith('.') and entry.name.startswith(prefix)
+                    and entry.name.endswith(suffixes) and entry.is_file()]
+    except OSError:
+        return []
+
+
+def scan_expression_dir(expression_dir: Path) -> Tuple[bool, List[Path], bool]:
+    """
+    Find Description.ini, .aseprite sources and Frames/ of an expression in one pass.
+    
+    Args:
+        expression_dir: Path to the expression directory
+        
+    Returns:
+        Tuple of (has_description, aseprite_files, has_frames_dir)
+    """
+    has_description = False
+    aseprite_files = []
+    has_frames_dir = False
+    
+    with os.scandir(expression_dir) as entries:
+        for entry in entries:
+            if entry.name == "Description.ini":
+                has_description = entry.is_file()
+            elif entry.name == "Frames":
+                has_frames_dir = entry.is_dir()
+            elif (entry.name.endswith(('.aseprite', '.ase')) and not entry.name.startswith('.')
+                  and entry.is_file()):
+                aseprite_files.append(Path(entry.path))
+    
+    return has_description, aseprite_files, has_frames_dir
+
+
+def open_monochrome_image(png_file: Path) -> Image.Image:
+    """
+    Open PNG frame as 1-bit image with display polarity applied.
+    
+    Args:
+        png_file: Input PNG file path
+        
+    Returns:
+        PIL image in '1' mode, set pixels are lit on display
+    """
+    # Close the file as soon as the frame is converted,
+    # on Windows temporary PNGs can't be deleted while open
+    with Image.open(png_file) as src:
+        img = src
+        
+        # Convert color images to grayscale first, then to 1-bit monochrome.
+        # Direct color -> '1' conversion dithers differently, so only
+        # grayscale and 1-bit images skip the intermediate step.
+        if img.mode not in ('1', 'L'):
+            img = img.convert('L')  # Grayscale
+        if img.mode != '1':
+            # Pure black & white frames leave no error to diffuse, so plain
+            # thresholding gives the same result much faster than dithering
+            if any(img.histogram()[1:255]):
+                img = img.convert('1')  # 1-bit monochrome (black & white)
+            else:
+                img = img.convert('1', dither=Image.Dither.NONE)
+        if INVERT_OUTPUT:
+            img = ImageChops.invert(img)
+        
+        # Already 1-bit source, keep a copy that outlives the file
+        if img is src:
+            img = src.copy()
+    
+    return img
+
+
+def convert_png_to_u8g2_format(png_file: Path) -> Tuple[Optional[bytes], int, int]:
+    """
+    Convert PNG to u8g2-compatible monochrome binary format.
+    
+    Module-level function so it can be run in worker processes.
+    
+    Format (optimized):
+    - N bytes: monochrome bitmap data (1 bit per pixel, packed)
+    
+    Dimensions are stored in Description.ini instead of each frame file.
+    This reduces file size and speeds up loading since dimensions
+    are read once and reused for all frames.
+    
+    Args:
+        png_file: Input PNG file path
+        
+    Returns:
+        Tuple of (bitmap data, width, height), bitmap data is None on failure
+    """
+    try:
+        # Open and convert to monochrome
+        img = open_monochrome_image(png_file)
+        
+        width, height = img.size
+        
+        # Create binary data
+        # u8g2 expects data in column-major order with vertical bytes
+        # Each byte represents 8 vertical pixels
+        if PACK_EXTENSION_AVAILABLE:
+            bitmap_data = pack_u8g2(img.tobytes(), width, height)
+        elif NUMPY_AVAILABLE:
+            # In PIL '1' mode set bit = white, set bits become pixels on display.
+            # tobytes() gives rows MSB first padded to whole bytes, unpack and crop them.
+            raw = np.frombuffer(img.tobytes(), dtype=np.uint8)
+            arr = np.unpackbits(raw).reshape(height, -1)[:, :width]
+            
+            if NUMBA_AVAILABLE:
+                bitmap_data = pack_u8g2_numba(arr).tobytes()
+            else:
+                # Transpose to columns and pad them with off pixels to whole pages
+                columns = np.pad(arr.T, ((0, 0), (0, (-height) % 8)))
+                
+                # Bit N of each byte is pixel y_byte * 8 + N
+                bitmap_data = np.packbits(columns.reshape(width, -1, 8), axis=-1, bitorder='little').tobytes()
+        else:
+            # Preallocate output, one byte per 8 vertical pixels
+            pages = (height + 7) // 8  # Round up to nearest byte
+            bitmap_data = bytearray(width * pages)
+            i = 0
+            
+            # In PIL '1' mode: 0 = black, 255 = white
+            # For u8g2: 1 = pixel on, 0 = pixel off
+            pixels = img.load()
+            
+            # Process in vertical strips (u8g2 format)
+            for x in range(width):
+                for y_byte in range(pages):
+                    byte_val = 0
+                    for bit in range(min(8, height - y_byte * 8)):
+                        byte_val |= (pixels[x, y_byte * 8 + bit] & 1) << bit
+                    bitmap_data[i] = byte_val
+                    i += 1
+        
+        # Bitmap data only (no dimensions)
+        return bytes(bitmap_data), width, height
+        
+    except Exception as e:
+        print(f"      Error converting {png_file.name}: {e}")
+        return None, 0, 0
+
+
+def convert_pngs_to_u8g2_batch(png_files: List[Path]) -> List[Tuple[Optional[bytes], int, int]]:
+    """
+    Convert a batch of PNG frames to u8g2 format with one packbits call.
+    
+    Frames of the same size are stacked into a single 3D array and
+    packed together, which avoids per-frame numpy call overhead.
+    Module-level function so it can be run in worker processes.
+    
+    Args:
+        png_files: Input PNG file paths
+        
+    Returns:
+        List of (bitmap data, width, height) in input order, bitmap data is None on failure
+    """
+    if not NUMPY_AVAILABLE:
+        return [convert_png_to_u8g2_format(png_file) for png_file in png_files]
+    
+    results: List[Tuple[Optional[bytes], int, int]] = [(None, 0, 0)] * len(png_files)
+    groups: Dict[Tuple[int, int], List[Tuple[int, "np.ndarray"]]] = {}
+    
+    for index, png_file in enumerate(png_files):
+        try:
+            img = open_monochrome_image(png_file)
+            width, height = img.size
+            raw = np.frombuffer(img.tobytes(), dtype=np.uint8)
+            arr = np.unpackbits(raw).reshape(height, -1)[:, :width]
+            groups.setdefault((width, height), []).append((index, arr))
+        except Exception as e:
+            print(f"      Error converting {png_file.name}: {e}")
+    
+    for (width, height), frames in groups.items():
+        # Stack as (frame, x, y) and pad columns with off pixels to whole pages
+        stack = np.stack([arr.T for _, arr in frames])
+        stack = np.pad(stack, ((0, 0), (0, 0), (0, (-height) % 8)))
+        
+        # Bit N of each byte is pixel y_byte * 8 + N
+        packed = np.packbits(stack.reshape(len(frames), width, -1, 8), axis=-1, bitorder='little')
+        packed = packed.reshape(len(frames), -1)
+        
+        for (index, _), frame_data in zip(frames, packed):
+            results[index] = (frame_data.tobytes(), width, height)
+    
+    return results
+
+
+class GraphicsStructureGenerator:
+    """Main class for generating graphics structure."""
+    
+    def __init__(self, graphics_dir: Path):
+        """
+        Initialize the generator.
+        
+        Args:
+            graphics_dir: Path to the assets/graphics directory
+        """
+        self.graphics_dir = graphics_dir
+        self.description_file = graphics_dir / "Description.ini"
+        self.enabled_libraries: List[str] = []
+        self.executor: Optional[ProcessPoolExecutor] = None
+        
+    def read_libraries_config(self) -> None:
+        """
+        Read Description.ini and populate enabled libraries list.
+        
+        Parsed libraries are cached in LIBRARIES_CACHE_FILE_NAME keyed by
+        modification time and size of Description.ini, so the file is
+        only parsed again after it changes.
+        """
+        try:
+            stat = self.description_file.stat()
+        except OSError:
+            print(f"Error: {self.description_file} not found!")
+            sys.exit(1)
+        
+        cache_file = self.description_file.with_name(LIBRARIES_CACHE_FILE_NAME)
+        libraries = None
+        try:
+            cache = json.loads(cache_file.read_text())
+            if cache['mtime'] == stat.st_mtime_ns and cache['size'] == stat.st_size:
+                libraries = cache['libraries']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        
+        if libraries is None:
+            # [Libraries] holds only "name = true/false" lines, names keep their case
+            libraries = {}
+            section = None
+            found_section = False
+            for line in self.description_file.read_text().splitlines():
+                line = line.strip()
+                if not line or line.startswith((';', '#')):
+                    continue
+                if line.startswith('['):
+                    section = line.strip('[]').strip()
+                    if section == 'Libraries':
+                        found_section = True
+                elif section == 'Libraries':
+                    library_name, _, enabled = line.partition('=')
+                    libraries[library_name.strip()] = enabled.strip()
+            
+            if not found_section:
+                print("Error: [Libraries] section not found in Description.ini!")
+                sys.exit(1)
+            try:
+                cache_file.write_text(json.dumps({
+                    'mtime': stat.st_mtime_ns,
+                    'size': stat.st_size,
+                    'libraries': libraries,
+                }))
+            except OSError:
+                pass
+            
+        for library_name, enabled in libraries.items():
+            if enabled.lower() == 'true':
+                self.enabled_libraries.append(library_name)
+                print(f"✓ Library '{library_name}' is enabled")
+            else:
+                print(f"✗ Library '{library_name}' is disabled")
+    
+    def create_library_directories(self) -> None:
+        """Create directories for enabled libraries if they don't exist."""
+        # Ensure libraries directory exists
+        libraries_root = self.graphics_dir / "libraries"
+        libraries_root.mkdir(exist_ok=True)
+        
+        for library_name in self.enabled_libraries:
+            library_path = libraries_root / library_name
+            if not library_path.exists():
+                library_path.mkdir(parents=True, exist_ok=True)
+                print(f"Created library directory: {library_path}")
+            else:
+                print(f"Library directory already exists: {library_path}")
+    
+    def default_expression_description(self, expression_name: str) -> str:
+        """
+        Build default Description.ini content for an expression.
+        
+        Args:
+            expression_name: Name of the expression
+            
+        Returns:
+            Description.ini content
+        """
+        return DEFAULT_DESCRIPTION_TEMPLATE % expression_name
+    
+    def load_expression_description(self, expression_dir: Path, expression_name: str,
+                                    exists: bool = True) -> Tuple[configparser.ConfigParser, bool]:
+        """
+        Load Description.ini of an expression, or default content if it doesn't exist.
+        
+        The file is parsed once per expression, all updates are made in
+        memory and written with write_expression_description().
+        
+        Args:
+            expression_dir: Path to the expression directory
+            expression_name: Name of the expression
+            exists: False if Description.ini is known to be missing
+            
+        Returns:
+            Tuple of (config, created), created is True if default content was generated
+        """
+        desc_file = expression_dir / "Description.ini"
+        config = configparser.ConfigParser()
+        config.optionxform = str  # Preserve case
+        
+        content = None
+        if exists:
+            try:
+                content = desc_file.read_text()
+            except FileNotFoundError:
+                pass
+        
+        if content is not None:
+            print(f"  Description.ini already exists for '{expression_name}'")
+            config.read_string(content, source=str(desc_file))
+            return config, False
+        
+        config.read_string(self.default_expression_description(expression_name))
+        print(f"  Generated Description.ini for '{expression_name}'")
+        return config, True
+    
+    def write_expression_description(self, expression_dir: Path, config: configparser.ConfigParser) -> None:
+        """
+        Write Description.ini of an expression.
+        
+        Args:
+            expression_dir: Path to the expression directory
+            config: Expression description to write
+        """
+        with open(expression_dir / "Description.ini", 'w') as f:
+            config.write(f, space_around_delimiters=True)
+    
+    def update_description_dimensions(self, config: configparser.ConfigParser, width: int, height: int,
+                                      frame_count: int, fps: float = None, source_hash: str = None) -> None:
+        """
+        Update expression description with frame dimensions, frame count and FPS.
+        
+        Args:
+            config: Expression description loaded by load_expression_description()
+            width: Frame width in pixels
+            height: Frame height in pixels
+            frame_count: Number of frames in Frames.bin
+            fps: Animation FPS (optional, will not update if None)
+            source_hash: Hash of the source .aseprite files (optional, stored in [Cache])
+        """
+        # Ensure [Dimensions] section exists
+        if 'Dimensions' not in config:
+            config.add_section('Dimensions')
+        
+        # Update dimensions
+        config['Dimensions']['Width'] = str(width)
+        config['Dimensions']['Height'] = str(height)
+        
+        # Layout of concatenated Frames.bin, frame N starts at N * FrameStride
+        config['Dimensions']['FrameCount'] = str(frame_count)
+        config['Dimensions']['FrameStride'] = str(width * ((height + 7) // 8))
+        
+        # Update FPS if provided
+        if fps is not None:
+            if 'Loop' in config:
+                config['Loop']['AnimationFPS'] = str(int(fps)) if fps == int(fps) else f"{fps:.1f}"
+        
+        # Remember which sources the frames were generated from
+        if source_hash is not None:
+            if 'Cache' not in config:
+                config.add_section('Cache')
+            config['Cache']['SourceHash'] = source_hash
+        
+        fps_info = f", FPS={fps:.1f}" if fps is not None else ""
+        print(f"    Updated Description.ini with dimensions: {width}x{height}{fps_info}")
+    
+    def compute_source_hash(self, aseprite_files: List[Path]) -> str:
+        """
+        Hash the contents of an expression's .aseprite files.
+        
+        Args:
+            aseprite_files: List of .aseprite file paths
+            
+        Returns:
+            Hex digest of all files
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        for aseprite_file in sorted(aseprite_files):
+            digest.update(aseprite_file.name.encode())
+            digest.update(aseprite_file.read_bytes())
+        return digest.hexdigest()
+    
+    def source_stamp(self, aseprite_files: List[Path]) -> str:
+        """
+        Describe an expression's .aseprite files by modification time and size.
+        
+        Args:
+            aseprite_files: List of .aseprite file paths
+            
+        Returns:
+            Stamp text, one "name mtime_ns size" line per file
+        """
+        lines = []
+        for aseprite_file in sorted(aseprite_files):
+            stat = aseprite_file.stat()
+            lines.append(f"{aseprite_file.name} {stat.st_mtime_ns} {stat.st_size}\n")
+        return "".join(lines)
+    
+    def frames_up_to_date(self, frames_dir: Path, aseprite_files: List[Path], stamp: str) -> bool:
+        """
+        Check whether exported frames are newer than their sources.
+        
+        Frames are up to date if Frames.bin exists and the stamp written by
+        the last export matches, so only one small file is read. Frames
+        exported before stamps were written are up to date if Frames.bin
+        is newer than every source file.
+        
+        Args:
+            frames_dir: Directory with exported frames
+            aseprite_files: List of .aseprite file paths
+            stamp: Current stamp of the source files
+            
+        Returns:
+            True if export can be skipped
+        """
+        frames_file = frames_dir / FRAMES_FILE_NAME
+        if not frames_file.is_file():
+            return False
+        
+        try:
+            return (frames_dir / STAMP_FILE_NAME).read_text() == stamp
+        except OSError:
+            pass
+        
+        return frames_file.stat().st_mtime > max(f.stat().st_mtime for f in aseprite_files)
+    
+    def export_aseprite_frames(self, aseprite_file: Path, aseprite_cmd: str,
+                               log: Callable[[str], None] = print) -> Tuple[List[Path], float]:
+        """
+        Export Aseprite animation to PNG frame sequence and read its FPS.
+        
+        Frames and JSON metadata are produced by a single Aseprite run into
+        a temporary directory (in /dev/shm when available), which is removed
+        by process_and_convert_frames() after conversion.
+        
+        Args:
+            aseprite_file: Path to the .aseprite file
+            aseprite_cmd: Path to aseprite executable
+            log: Function printing progress messages
+            
+        Returns:
+            Tuple of (exported PNG file paths, FPS), FPS is 20.0 if it cannot be extracted
+        """
+        if aseprite_cmd is None:
+            return [], 20.0
+            
+        # Create temporary directory for PNG export
+        temp_png_dir = Path(tempfile.mkdtemp(prefix="bobot_frames_", dir=TEMP_FRAMES_ROOT))
+        
+        # Export frames as PNG sequence
+        # Frame naming: Frame_000.png, Frame_001.png, etc.
+        # Zero-padded {frame000} (0-indexed) keeps name order equal to frame order
+        output_pattern = temp_png_dir / "Frame_{frame000}.png"
+        
+        # Temporary JSON file for metadata
+        json_path = temp_png_dir / "metadata.json"
+        png_files = []
+        
+        try:
+            cmd = [
+                aseprite_cmd,
+                '-b',  # Batch mode
+                str(aseprite_file),
+                '--data', str(json_path),
+                '--format', 'json-array',
+                '--list-tags',
+                '--save-as',
+                str(output_pattern)
+            ]
+            
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+            
+            if result.returncode == 0:
+                fps = self.read_aseprite_fps(json_path, log)
+                
+                # Get list of exported PNG files, sorted by frame number
+                png_files = sorted(scan_files(temp_png_dir, ('.png',), "Frame_"))
+                
+                log(f"    Exported {len(png_files)} PNG frames from {aseprite_file.name}")
+                return png_files, fps
+            else:
+                log(f"    Error exporting frames: {result.stderr}")
+                return [], 20.0
+                
+        except subprocess.TimeoutExpired:
+            log(f"    Timeout while exporting {aseprite_file.name}")
+            return [], 20.0
+        except Exception as e:
+            log(f"    Error: {e}")
+            return [], 20.0
+        finally:
+            # Nothing to convert, remove temporary directory right away
+            if not png_files:
+                shutil.rmtree(temp_png_dir, ignore_errors=True)
+    
+    def export_u8g2_frames(self, aseprite_file: Path, frames_dir: Path, aseprite_cmd: str,
+                           log: Callable[[str], None] = print) -> Tuple[int, int, int, float]:
+        """
+        Export Aseprite animation directly to u8g2 binary frames.
+        
+        Runs U8G2_EXPORT_SCRIPT inside Aseprite, which flattens and packs
+        every frame itself, so no PNG files are decoded in Python. The
+        script only thresholds, so it refuses sprites with gray pixels,
+        those have to be dithered by the PNG conversion instead.
+        
+        Args:
+            aseprite_file: Path to the .aseprite file
+            frames_dir: Directory to save binary frames
+            aseprite_cmd: Path to aseprite executable
+            log: Function printing progress messages
+            
+        Returns:
+            Tuple of (frame_count, width, height, fps), frame_count is 0 on failure
+            or if the sprite has gray pixels
+        """
+        try:
+            cmd = [
+                aseprite_cmd,
+                '-b',  # Batch mode
+                str(aseprite_file),
+                '--script-param', f'outdir={frames_dir}',
+                '--script-param', f'invert={int(INVERT_OUTPUT)}',
+                '--script', str(U8G2_EXPORT_SCRIPT)
+            ]
+            
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+            
+            if result.returncode != 0:
+                log(f"    Error running export script: {result.stderr}")
+                return 0, 0, 0, 20.0
+            
+            # Script prints "<width> <height> <frame count> <first frame duration ms>"
+            lines = result.stdout.strip().splitlines()
+            if lines and lines[-1] == "gray":
+                log(f"    {aseprite_file.name} has gray pixels, exporting PNG frames for dithering")
+                return 0, 0, 0, 20.0
+            
+            width, height, frame_count, duration_ms = (int(value) for value in lines[-1].split())
+            
+            # Convert duration to FPS
+            fps = 1000.0 / duration_ms if duration_ms > 0 else 20.0
+            log(f"    Detected FPS: {fps:.1f} (frame duration: {duration_ms}ms)")
+            
+            return frame_count, width, height, fps
+            
+        except subprocess.TimeoutExpired:
+            log(f"    Timeout while exporting {aseprite_file.name}")
+        except (ValueError, IndexError):
+            log(f"    Unexpected export script output: {result.stdout!r}")
+        except Exception as e:
+            log(f"    Error: {e}")
+        
+        return 0, 0, 0, 20.0
+    
+    def read_aseprite_fps(self, json_path: Path, log: Callable[[str], None] = print) -> float:
+        """
+        Extract FPS from Aseprite JSON metadata by reading first frame duration.
+        
+        Args:
+            json_path: Path to JSON written by aseprite --data
+            log: Function printing progress messages
+            
+        Returns:
+            FPS value (default 20.0 if cannot extract)
+        """
+        try:
+            with open(json_path, 'r') as f:
+                data = json.load(f)
+            
+            # Extract duration from first frame (in milliseconds)
+            if 'frames' in data and len(data['frames']) > 0:
+                first_frame = data['frames'][0]
+                duration_ms = first_frame.get('duration', 50)  # Default 50ms if not found
+                
+                # Convert duration to FPS
+                fps = 1000.0 / duration_ms
+                
+                log(f"    Detected FPS: {fps:.1f} (frame duration: {duration_ms}ms)")
+                return fps
+                
+        except Exception as e:
+            log(f"    Warning: Could not extract FPS from Aseprite file: {e}")
+        
+        # Return default FPS
+        return 20.0
+    
+    def process_and_convert_frames(self, png_files: List[Path], frames_dir: Path) -> Tuple[int, int, int]:
+        """
+        Convert PNG frames to u8g2 binary format and clean up.
+        
+        Converted frames are concatenated into a single Frames.bin.
+        
+        Args:
+            png_files: List of PNG file paths to convert
+            frames_dir: Directory to save Frames.bin
+            
+        Returns:
+            Tuple of (converted_count, width, height)
+        """
+        frames_dir.mkdir(exist_ok=True)
+        converted_count = 0
+        frame_width = 0
+        frame_height = 0
+        frame_stride = 0
+        frames_data = bytearray()
+        
+        # Frames are independent, convert them in worker processes when available
+        chunksize = max(1, len(png_files) // (4 * (os.cpu_count() or 1)))
+        if NUMPY_AVAILABLE and not (NUMBA_AVAILABLE or PACK_EXTENSION_AVAILABLE):
+            # Without a compiled packer pack each chunk of frames with one numpy call
+            batches = [png_files[i:i + chunksize] for i in range(0, len(png_files), chunksize)]
+            if self.executor is not None and len(batches) > 1:
+                batch_results = self.executor.map(convert_pngs_to_u8g2_batch, batches)
+            else:
+                batch_results = map(convert_pngs_to_u8g2_batch, batches)
+            results = (result for batch in batch_results for result in batch)
+        elif self.executor is not None and len(png_files) > 1:
+            results = self.executor.map(convert_png_to_u8g2_format, png_files, chunksize=chunksize)
+        else:
+            results = map(convert_png_to_u8g2_format, png_files)
+        
+        for png_file, (bitmap_data, width, height) in zip(png_files, results):
+            if bitmap_data is None:
+                continue
+            
+            # Store dimensions from first frame, all frames share one stride
+            if converted_count == 0:
+                frame_width = width
+                frame_height = height
+                frame_stride = len(bitmap_data)
+                
+                # Sized for all frames, so copying a frame never resizes it
+                frames_data = bytearray(frame_stride * len(png_files))
+            elif (width, height) != (frame_width, frame_height):
+                print(f"      Warning: {png_file.name} is {width}x{height}, expected "
+                      f"{frame_width}x{frame_height}, skipping")
+                continue
+            
+            offset = converted_count * frame_stride
+            frames_data[offset:offset + frame_stride] = bitmap_data
+            converted_count += 1
+        
+        # All frames go to one file in a single write, frame N starts at N * stride
+        if converted_count > 0:
+            (frames_dir / FRAMES_FILE_NAME).write_bytes(memoryview(frames_data)[:converted_count * frame_stride])
+        
+        # Clean up temporary PNG directory
+        if png_files:
+            shutil.rmtree(png_files[0].parent, ignore_errors=True)
+        
+        return converted_count, frame_width, frame_height
+    
+    def process_library(self, library_name: str) -> List[ExpressionJob]:
+        """
+        Process a single library: generate descriptions and collect expressions to export.
+        
+        Args:
+            library_name: Name of the library to process
+            
+        Returns:
+            Export jobs for expressions whose frames need export
+        """
+        library_path = self.graphics_dir / "libraries" / library_name
+        
+        try:
+            with os.scandir(library_path) as entries:
+                expression_dirs = [Path(entry.path) for entry in entries if entry.is_dir()]
+        except OSError:
+            print(f"  Library directory not found: {library_name}")
+            return []
+        
+        # Iterate over all directories in the library (each is an expression)
+        jobs = []
+        for expression_dir in expression_dirs:
+            job = self.prepare_expression(expression_dir)
+            if job is not None:
+                jobs.append(job)
+        
+        return jobs
+    
+    def prepare_expression(self, expression_dir: Path) -> Optional[ExpressionJob]:
+        """
+        Prepare a single expression: generate description and check its frames.
+        
+        Description.ini is written right away if there is nothing to
+        export, otherwise once its frames are exported.
+        
+        Args:
+            expression_dir: Path to the expression directory
+            
+        Returns:
+            Export job for the expression, or None if frames don't need export
+        """
+        expression_name = expression_dir.name
+        print(f"  Processing expression: {expression_name}")
+        
+        # One directory listing finds description, .aseprite files and frames
+        has_description, aseprite_files, has_frames_dir = scan_expression_dir(expression_dir)
+        
+        # Load Description.ini, default content is generated if needed
+        config, created = self.load_expression_description(expression_dir, expression_name, has_description)
+        
+        if not aseprite_files:
+            print("    No .aseprite file found, skipping frame export")
+            self.finish_expression(expression_dir, config, created, False)
+            return None
+        
+        # Skip expressions whose sources did not change since last export,
+        # a newly generated description still needs dimensions from export
+        frames_dir = expression_dir / "Frames"
+        stamp = self.source_stamp(aseprite_files)
+        if not created and has_frames_dir and self.frames_up_to_date(frames_dir, aseprite_files, stamp):
+            print("    ✓ Frames are up to date, skipping export")
+            self.finish_expression(expression_dir, config, created, False)
+            return None
+        
+        # Mtimes are not reliable after a fresh checkout, compare stored source hash too
+        source_hash = self.compute_source_hash(aseprite_files)
+        if (has_frames_dir and config.get('Cache', 'SourceHash', fallback=None) == source_hash
+                and (frames_dir / FRAMES_FILE_NAME).is_file()):
+            (frames_dir / STAMP_FILE_NAME).write_text(stamp)
+            print("    ✓ Frames are up to date, skipping export")
+            self.finish_expression(expression_dir, config, created, False)
+            return None
+        
+        # Frames.bin is overwritten by export, only remove other old/stale files
+        if has_frames_dir:
+            self.remove_stale_frames(frames_dir)
+        else:
+            frames_dir.mkdir()
+        
+        return expression_dir, config, created, aseprite_files, source_hash, stamp
+    
+    def remove_stale_frames(self, frames_dir: Path) -> None:
+        """
+        Remove everything except Frames.bin from a Frames directory before export.
+        
+        Removes per-frame Frame_XX.bin files of the old layout and the
+        stamp, so an interrupted export is not taken as up to date.
+        
+        Args:
+            frames_dir: Directory with exported frames
+        """
+        removed = 0
+        with os.scandir(frames_dir) as entries:
+            for entry in entries:
+                if entry.name == FRAMES_FILE_NAME:
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+                removed += 1
+        
+        if removed:
+            print(f"    Removed {removed} old frame files")
+    
+    def finish_expression(self, expression_dir: Path, config: configparser.ConfigParser,
+                          created: bool, updated: bool) -> None:
+        """
+        Write Description.ini of an expression if it was generated or changed.
+        
+        Args:
+            expression_dir: Path to the expression directory
+            config: Expression description
+            created: Description was generated from default template
+            updated: Description was changed in memory
+        """
+        if updated:
+            self.write_expression_description(expression_dir, config)
+        elif created:
+            # Nothing changed, keep comments of the default template
+            (expression_dir / "Description.ini").write_text(self.default_expression_description(expression_dir.name))
+    
+    def export_frames(self, aseprite_file: Path, frames_dir: Path, aseprite_cmd: str,
+                      log: Callable[[str], None]) -> Tuple[Optional[List[Path]], float, int, int, int]:
+        """
+        Run Aseprite export for one .aseprite file.
+        
+        Args:
+            aseprite_file: Path to the .aseprite file
+            frames_dir: Directory to save binary frames
+            aseprite_cmd: Path to aseprite executable (or None)
+            log: Function printing progress messages
+            
+        Returns:
+            Tuple of (png_files, fps, frame_count, width, height). png_files is
+            None if the export script already wrote the frames, frame count and
+            dimensions are only set in that case.
+        """
+        # Let Aseprite write u8g2 frames itself when the export script is available,
+        # sprites with gray pixels go through PNG export to keep dithering
+        if aseprite_cmd is not None and U8G2_EXPORT_SCRIPT.exists():
+            frame_count, width, height, fps = self.export_u8g2_frames(aseprite_file, frames_dir, aseprite_cmd, log)
+            if frame_count > 0:
+                return None, fps, frame_count, width, height
+            
+            log("    Falling back to PNG export")
+        
+        # Export to PNG and extract FPS in one Aseprite run
+        png_files, fps = self.export_aseprite_frames(aseprite_file, aseprite_cmd, log)
+        return png_files, fps, 0, 0, 0
+    
+    def export_expression(self, job: ExpressionJob, aseprite_cmd: str) -> List[Tuple[Path, tuple, List[str]]]:
+        """
+        Run Aseprite export for all .aseprite files of one expression.
+        
+        Called from export worker threads, so messages are returned
+        instead of printed.
+        
+        Args:
+            job: Expression returned by prepare_expression()
+            aseprite_cmd: Path to aseprite executable (or None)
+            
+        Returns:
+            List of (aseprite_file, export_frames() result, messages)
+        """
+        expression_dir, _, _, aseprite_files, _, _ = job
+        exports = []
+        for aseprite_file in aseprite_files:
+            messages = []
+            result = self.export_frames(aseprite_file, expression_dir / "Frames", aseprite_cmd, messages.append)
+            exports.append((aseprite_file, result, messages))
+        return exports
+    
+    def export_expressions(self, jobs: List[ExpressionJob], aseprite_cmd: str) -> None:
+        """
+        Export and convert frames of prepared expressions.
+        
+        Up to EXPORT_WORKERS expressions are exported by Aseprite at the
+        same time while the main thread converts frames of already exported
+        ones. Expressions are finished and their messages printed in job
+        order, so the output stays coherent. Only a few exports run ahead,
+        so at most a few PNG sequences wait in temporary storage.
+        
+        Args:
+            jobs: Expressions returned by prepare_expression()
+            aseprite_cmd: Path to aseprite executable (or None)
+        """
+        with ThreadPoolExecutor(max_workers=EXPORT_WORKERS) as pool:
+            pending = deque()
+            remaining = iter(jobs)
+            
+            def submit_next() -> None:
+                job = next(remaining, None)
+                if job is not None:
+                    pending.append((job, pool.submit(self.export_expression, job, aseprite_cmd)))
+            
+            for _ in range(EXPORT_WORKERS):
+                submit_next()
+            
+            while pending:
+                job, future = pending.popleft()
+                submit_next()
+                
+                expression_dir, config, created, _, source_hash, stamp = job
+                updated = False
+                print(f"  Exporting expression: {expression_dir.parent.name}/{expression_dir.name}")
+                
+                for aseprite_file, result, messages in future.result():
+                    png_files, fps, converted_count, width, height = result
+                    
+                    print(f"    Exporting frames from {aseprite_file.name}...")
+                    for message in messages:
+                        print(message)
+                    
+                    if png_files is None:
+                        print(f"    ✓ Exported {converted_count} frames ({width}x{height} pixels)")
+                    elif png_files:
+                        # Convert PNG to u8g2 binary format
+                        print(f"    Converting {len(png_files)} frames to u8g2 binary format...")
+                        converted_count, width, height = self.process_and_convert_frames(png_files, expression_dir / "Frames")
+                        print(f"    ✓ Converted {converted_count} frames ({width}x{height} pixels)")
+                    else:
+                        print(f"    No frames exported from {aseprite_file.name}")
+                    
+                    # Update Description.ini with dimensions and FPS
+                    if converted_count > 0:
+                        self.update_description_dimensions(config, width, height, converted_count, fps, source_hash)
+                        updated = True
+                
+                # Later runs skip the expression until its sources change
+                if updated:
+                    (expression_dir / "Frames" / STAMP_FILE_NAME).write_text(stamp)
+                
+                self.finish_expression(expression_dir, config, created, updated)
+    
+    def run(self) -> None:
+        """Main execution method."""
+        print("=" * 60)
+        print("Graphics Structure Generation Script")
+        print("=" * 60)
+        print()
+        
+        # Read configuration
+        print("Reading library configuration...")
+        self.read_libraries_config()
+        print()
+        
+        # Create library directories
+        print("Creating library directories...")
+        self.create_library_directories()
+        print()
+        
+        # Find Aseprite
+        print("Looking for Aseprite executable...")
+        aseprite_cmd = find_aseprite_executable()
+        if aseprite_cmd:
+            print(f"Found Aseprite at: {aseprite_cmd}")
+        print()
+        
+        # Process each enabled library, expressions of all libraries are exported together
+        print("Processing libraries...")
+        jobs = []
+        for library_name in self.enabled_libraries:
+            print(f"\nProcessing library: {library_name}")
+            print("-" * 60)
+            jobs += self.process_library(library_name)
+        
+        # Export frames, converted in a shared process pool
+        if jobs:
+            print(f"\nExporting frames of {len(jobs)} expressions...")
+            print("-" * 60)
+            # Workers are started while export threads run, forking then can deadlock
+            with ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn')) as executor:
+                self.executor = executor
+                self.export_expressions(jobs, aseprite_cmd)
+            self.executor = None
+        
+        print()
+        print("=" * 60)
+        print("Graphics structure generation complete!")
+        print("=" * 60)
+
+
+def main():
+    """Main entry point."""
+    # Determine graphics directory
+    # Script can be run from anywhere, but we need to find assets/graphics
+    
+    # Try to find project root (look for CMakeLists.txt)
+    current_dir = Path.cwd()
+    project_root = None
+    
+    # Search upwards for project root
+    for parent in [current_dir] + list(current_dir.parents):
+        if (parent / "CMakeLists.txt").exists():
+            project_root = parent
+            break
+    
+    if project_root is None:
+        # Try current directory
+        project_root = current_dir
+    
+    graphics_dir = project_root / "assets" / "graphics"
+    
+    if not graphics_dir.exists():
+        print(f"Error: Graphics directory not found at {graphics_dir}")
+        print("Please run this script from the project root or ensure assets/graphics exists.")
+        sys.exit(1)
+    
+    print(f"Using graphics directory: {graphics_dir}")
+    print()
+    
+    # Run the generator
+    generator = GraphicsStructureGenerator(graphics_dir)
+    generator.run()
@@ -0,0 +1,49 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled u8g2 bitmap packer for _graphics_common.py
+
+Optional extension, build it in place with:
+
+    cythonize -i devtools/_pack.pyx
+
+Without it the script falls back to numba, numpy or pure Python packing.
+"""
+
+
+def pack_u8g2(const unsigned char[::1] raw, int width, int height):
+    """
+    Pack PIL '1' mode image data into u8g2 vertical bytes.
+
+    Works directly on Image.tobytes() output, so numpy is not needed.
+
+    Args:
+        raw: 1-bit rows, MSB first, each row padded to whole bytes
+        width: Image width in pixels
+        height: Image height in pixels
+
+    Returns:
+        Bitmap data with column-major vertical bytes, set bit = pixel on
+    """
+    cdef Py_ssize_t row_bytes = (width + 7) // 8
+    cdef Py_ssize_t pages = (height + 7) // 8
+    cdef Py_ssize_t x, y_byte, bit, y, k = 0
+    cdef unsigned char byte_val, mask
+
+    if raw.shape[0] < row_bytes * height:
+        raise ValueError("Image data is shorter than width x height")
+
+    out = bytearray(width * pages)
+    cdef unsigned char[::1] o = out
+
+    for x in range(width):
+        mask = 0x80 >> (x & 7)
+        for y_byte in range(pages):
+            byte_val = 0
+            for bit in range(8):
+                y = y_byte * 8 + bit
+                if y < height and raw[y * row_bytes + (x >> 3)] & mask:
+                    byte_val |= 1 << bit
+            o[k] = byte_val
+            k += 1
+
+    return bytes(out)
@@ -0,0 +1,87 @@
+-- Aseprite script exporting sprite frames directly in u8g2 binary format
+--
+-- Used by generate_graphics_structure.py to skip the intermediate PNG
+-- export and conversion in Python. Can also be run manually:
+--
+--   aseprite -b Sprite.aseprite --script-param outdir=Frames --script export_u8g2.lua
+--
+-- Every frame is flattened and appended to outdir/Frames.bin: column-major
+-- order with vertical bytes, bit N of each byte is pixel y = page * 8 + N.
+-- Frame N starts at N * width * ceil(height / 8). White pixels are lit, or
+-- black ones with --script-param invert=1.
+--
+-- Only strictly black and white sprites are exported, where thresholding
+-- gives the same result as the dithering done by the PNG conversion in
+-- Python. If any pixel is gray, nothing is written and "gray" is printed,
+-- so the caller falls back to PNG export.
+--
+-- On success prints one line: "<width> <height> <frame count> <first frame duration ms>"
+
+local sprite = app.activeSprite
+if not sprite then
+  error("No sprite loaded")
+end
+
+local outdir = app.params["outdir"]
+if not outdir or outdir == "" then
+  error("Missing --script-param outdir=<directory>")
+end
+
+local invert = app.params["invert"] == "1"
+local lit_luminance = invert and 0 or 255
+
+local pc = app.pixelColor
+local width = sprite.width
+local height = sprite.height
+local pages = (height + 7) // 8
+local image = Image(width, height, ColorMode.RGB)
+local chunks = {}
+
+for _, frame in ipairs(sprite.frames) do
+  -- Flatten all visible layers of the frame
+  image:clear()
+  image:drawSprite(sprite, frame)
+
+  -- Raw RGBA bytes (Aseprite 1.3+) are much faster to read than getPixel()
+  local data = image.bytes
+  local stride = data and image.rowStride
+
+  local bytes = {}
+  for x = 0, width - 1 do
+    for page = 0, pages - 1 do
+      local value = 0
+      for bit = 0, 7 do
+        local y = page * 8 + bit
+        if y < height then
+          local r, g, b
+          if data then
+            local i = y * stride + x * 4 + 1
+            r, g, b = string.byte(data, i, i + 2)
+          else
+            local color = image:getPixel(x, y)
+            r, g, b = pc.rgbaR(color), pc.rgbaG(color), pc.rgbaB(color)
+          end
+          -- Same fixed point luminance as Pillow's grayscale conversion
+          local luminance = (r * 19595 + g * 38470 + b * 7471 + 0x8000) >> 16
+          if luminance ~= 0 and luminance ~= 255 then
+            print("gray")
+            return
+          end
+          if luminance == lit_luminance then
+            value = value | (1 << bit)
+          end
+        end
+      end
+      bytes[#bytes + 1] = string.char(value)
+    end
+  end
+
+  chunks[#chunks + 1] = table.concat(bytes)
+end
+
+local file = assert(io.open(app.fs.joinPath(outdir, "Frames.bin"), "wb"))
+file:write(table.concat(chunks))
+file:close()
+
+local duration_ms = math.floor(sprite.frames[1].duration * 1000 + 0.5)
+print(string.format("%d %d %d %d", width, height, #sprite.frames, duration_ms))
@@ -7,15 +7,67 @@ It discovers the device using mDNS or connects to a manually specified IP addres
 """
 
 import argparse
+import asyncio
+import functools
+import gzip
+import hashlib
+import http.client
+import mmap
 import os
 import sys
 import time
 import json
+import queue
 import socket
+import threading
 import requests
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, List, Tuple
-from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from typing import Optional, Callable, Iterable, Iterator, List, Tuple
+from urllib.parse import quote, urlsplit
+
+# (file_path, relative_path, file_size) of one file to upload
+FileEntry = Tuple[str, str, int]
+
+# Number of files read ahead while uploading serially, and the largest file worth prefetching
+PREFETCH_QUEUE_SIZE = 2
+PREFETCH_MAX_BYTES = 1024 * 1024
+
+# Files at least this large are hashed through mmap instead of a single read
+HASH_MMAP_MIN_BYTES = 1024 * 1024
+
+# Formats that are already compressed and gain nothing from gzip
+COMPRESSED_SUFFIXES = frozenset({'.png', '.jpg', '.jpeg', '.gz', '.zip'})
+
+# Keep-alive sockets used by --sendfile uploads, one per worker thread
+_sendfile_connections = threading.local()
+
+# Local hash cache, keyed by file path and validated by mtime and size
+HASH_CACHE_FILE = Path(__file__).parent / '.bobot_upload_cache.json'
+
+# Try to import blake3 for faster manifest hashing
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Try to import tqdm for the upload progress bar
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
+
+# Try to import aiohttp for event-loop based uploads (--async)
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
 
 # Try to import zeroconf for mDNS discovery
 try:
@@ -27,7 +79,7 @@ try:
         
         def __init__(self):
             self.found_ip: Optional[str] = None
-            self.found = False
+            self.found = threading.Event()
         
         def add_service(self, zc: Zeroconf, type_: str, name: str) -> None:
             """Called when a service is discovered"""
@@ -36,7 +88,7 @@ try:
                 addresses = [socket.inet_ntoa(addr) for addr in info.addresses]
                 if addresses:
                     self.found_ip = addresses[0]
-                    self.found = True
+                    self.found.set()
                     print(f"✓ Found Bobot at {self.found_ip}:{info.port}")
         
         def remove_service(self, zc: Zeroconf, type_: str, name: str) -> None:
@@ -51,7 +103,69 @@ except ImportError:
     print("You can still use --ip to specify IP address manually.\n")
 
 
-def discover_bobot(timeout: int = 10) -> Optional[str]:
+class ProgressLine:
+    """
+    Single-line progress display used when tqdm is not installed
+    
+    Implements the subset of the tqdm interface used by the uploader. The
+    line is redrawn in place at most once per refresh interval, so console
+    output does not slow down uploads of many small files.
+    """
+    
+    def __init__(self, total: int, refresh_interval: float = 0.1):
+        self.total = total
+        self.done = 0
+        self.postfix = ""
+        self.refresh_interval = refresh_interval
+        self.last_render = 0.0
+    
+    def update(self, n: int) -> None:
+        """Advance progress by n bytes"""
+        self.done += n
+        now = time.monotonic()
+        if now - self.last_render >= self.refresh_interval:
+            self.last_render = now
+            self._render()
+    
+    def set_postfix_str(self, text: str) -> None:
+        """Set text displayed after the progress numbers"""
+        self.postfix = text
+    
+    def write(self, message: str) -> None:
+        """Print a message above the progress line"""
+        sys.stdout.write("\r\033[K" + message + "\n")
+        self._render()
+    
+    def close(self) -> None:
+        """Draw final state and move to next line"""
+        self._render()
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+    
+    def _render(self) -> None:
+        percent = (self.done / self.total) * 100 if self.total else 100.0
+        sys.stdout.write(
+            f"\r\033[K  {percent:5.1f}% | {self.done / 1024:.1f}/{self.total / 1024:.1f} KB | {self.postfix}"
+        )
+        sys.stdout.flush()
+
+
+def create_progress_bar(total: int):
+    """
+    Create byte-based progress bar, tqdm if available
+    
+    Args:
+        total: Total number of bytes to upload
+        
+    Returns:
+        tqdm instance or ProgressLine fallback
+    """
+    if TQDM_AVAILABLE:
+        return tqdm(total=total, unit='B', unit_scale=True, unit_divisor=1024)
+    return ProgressLine(total)
+
+
+def discover_bobot(timeout: int = 2) -> Optional[str]:
     """
     Discover Bobot device using mDNS
     
@@ -73,10 +187,8 @@ def discover_bobot(timeout: int = 10) -> Optional[str]:
         listener = BobotDiscoveryListener()
         browser = ServiceBrowser(zeroconf, "_http._tcp.local.", listener)
         
-        # Wait for discovery
-        start_time = time.time()
-        while not listener.found and (time.time() - start_time) < timeout:
-            time.sleep(0.5)
+        # Wait until the listener reports a match or the timeout expires
+        listener.found.wait(timeout=timeout)
         
         zeroconf.close()
         
@@ -92,75 +204,873 @@ def discover_bobot(timeout: int = 10) -> Optional[str]:
         return "192.168.4.1"
 
 
-def get_file_list(assets_dir: Path, exclude_patterns: List[str] = None) -> List[Tuple[Path, str]]:
+@functools.lru_cache(maxsize=None)
+def build_exclude_predicate(patterns: Tuple[str, ...]) -> Callable[[str], bool]:
     """
-    Get list of files to upload
+    Generate a predicate testing whether a name contains any of the patterns
+    
+    The pattern list is fixed for the whole scan, so it is unrolled into the
+    generated function body as a chain of constant 'in' tests. This avoids
+    iterating over the patterns, or running the regex engine, for every
+    directory entry.
     
     Args:
-        assets_dir: Assets directory path
-        exclude_patterns: List of file patterns to exclude
+        patterns: Substrings to look for (cached per distinct tuple)
         
     Returns:
-        List of (file_path, relative_path) tuples
+        Function taking a name and returning True if it should be excluded
     """
-    if exclude_patterns is None:
-        exclude_patterns = ['.aseprite', '.ase', '.git', '__pycache__', '.DS_Store']
+    if not patterns:
+        return lambda name: False
     
+    # repr() turns every pattern into a string literal, so no user text is executed as code
+    source = "def excluded(name):\n    return " + " or ".join(f"{p!r} in name" for p in patterns) + "\n"
+    namespace = {}
+    exec(compile(source, '<exclude-predicate>', 'exec'), namespace)
+    return namespace['excluded']
+
+
+def scan_directory(root: str, exclude_names: frozenset, exclude_suffixes: Tuple[str, ...],
+                   excluded: Callable[[str], bool]) -> List[FileEntry]:
+    """
+    Collect files under a directory tree using os.scandir
+    
+    Each DirEntry carries the type information from the directory read, so
+    only one stat per file is needed to get its size. Paths are kept as
+    plain strings, they are only opened once at upload time. Names used for
+    every entry are bound to locals to avoid global and attribute lookups
+    in the loop.
+    
+    Args:
+        root: Directory to scan
+        exclude_names: Exact file or directory names to exclude
+        exclude_suffixes: File name suffixes (extensions) to exclude
+        excluded: Predicate returning True for names to exclude
+        
+    Returns:
+        List of (file_path, relative_path, file_size) tuples
+    """
     files = []
+    append = files.append
+    scandir = os.scandir
+    
+    # Directories still to scan, as (path, relative path prefix)
+    pending = [(root, '')]
+    pop = pending.pop
+    push = pending.append
     
-    for root, dirs, filenames in os.walk(assets_dir):
-        # Filter out excluded directories
-        dirs[:] = [d for d in dirs if not any(pattern in d for pattern in exclude_patterns)]
+    while pending:
+        directory, prefix = pop()
         
-        for filename in filenames:
-            # Skip excluded files
-            if any(pattern in filename for pattern in exclude_patterns):
-                continue
-            
-            file_path = Path(root) / filename
-            relative_path = file_path.relative_to(assets_dir)
-            files.append((file_path, str(relative_path).replace('\\', '/')))
+        # Unreadable directories are skipped like os.walk does
+        try:
+            with scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name in exclude_names or excluded(name):
+                        continue
+                    
+                    # Symlinked directories are not followed, so links can't loop
+                    if entry.is_dir(follow_symlinks=False):
+                        push((entry.path, prefix + name + '/'))
+                    elif entry.is_file() and not name.endswith(exclude_suffixes):
+                        append((entry.path, prefix + name, entry.stat().st_size))
+        except OSError:
+            continue
     
     return files
 
 
-def upload_file(base_url: str, file_path: Path, relative_path: str) -> bool:
+def get_file_list(assets_dir: Path, exclude_names: Iterable[str] = None, exclude_suffixes: Tuple[str, ...] = None,
+                  exclude_patterns: Iterable[str] = ()) -> List[FileEntry]:
+    """
+    Get list of files to upload
+    
+    Args:
+        assets_dir: Assets directory path
+        exclude_names: Exact file or directory names to exclude
+        exclude_suffixes: File name suffixes (extensions) to exclude
+        exclude_patterns: Substrings, names containing any of them are excluded
+        
+    Returns:
+        List of (file_path, relative_path, file_size) tuples
+    """
+    if exclude_names is None:
+        exclude_names = ('.git', '.gitignore', '.gitkeep', '__pycache__', '.DS_Store',
+                         '.stamp', '.description.cache.json')
+    if exclude_suffixes is None:
+        exclude_suffixes = ('.aseprite', '.ase')
+    
+    excluded = build_exclude_predicate(tuple(exclude_patterns))
+    
+    return scan_directory(str(assets_dir), frozenset(exclude_names), tuple(exclude_suffixes), excluded)
+
+
+def create_session(pool_size: int) -> requests.Session:
+    """
+    Create HTTP session with keep-alive connection pool
+    
+    Dropped connections and 5xx responses are retried with exponential
+    backoff, so a flaky WiFi link does not fail the whole file. urllib3
+    rewinds file bodies before each retry.
+    
+    Args:
+        pool_size: Maximum number of pooled connections to the server
+        
+    Returns:
+        Configured requests session
+    """
+    retry = Retry(
+        total=4,
+        backoff_factor=0.3,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'POST']),
+        raise_on_status=False  # Return last response so its status can be reported
+    )
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    return session
+
+
+def read_file(file_path: str) -> bytes:
+    """
+    Read whole file content
+    
+    Args:
+        file_path: Path to the file
+        
+    Returns:
+        File content
+    """
+    with open(file_path, 'rb') as f:
+        return f.read()
+
+
+def gzip_payload(file_path: str, data: Optional[bytes]) -> Optional[bytes]:
+    """
+    Gzip file content for upload with Content-Encoding: gzip
+    
+    Level 1 is used because the WiFi link, not the host CPU, is the
+    bottleneck.
+    
+    Args:
+        file_path: Path to the file
+        data: Already read file content (optional, file is read if None)
+        
+    Returns:
+        Compressed content, or None if the format is already compressed
+    """
+    if os.path.splitext(file_path)[1].lower() in COMPRESSED_SUFFIXES:
+        return None
+    
+    if data is None:
+        data = read_file(file_path)
+    return gzip.compress(data, compresslevel=1)
+
+
+def format_http_error(status: int, body: bytes) -> str:
+    """
+    Format error line for a failed upload request
+    
+    Args:
+        status: HTTP status code
+        body: Response body, may hold a JSON object with 'message'
+        
+    Returns:
+        Error text including the server message when available
+    """
+    try:
+        message = json.loads(body).get('message')
+    except (ValueError, AttributeError):
+        message = None
+    
+    if message:
+        return f"✗ HTTP error {status}: {message}"
+    return f"✗ HTTP error {status}"
+
+
+def file_url(base_url: str, relative_path: str) -> str:
+    """
+    Build the /file upload URL for a relative path
+    
+    Slashes are kept literal because the server does not URL-decode the
+    path query parameter.
+    
+    Args:
+        base_url: Base URL of the server
+        relative_path: Relative path on the SD card
+        
+    Returns:
+        Upload URL
+    """
+    return base_url + file_target(relative_path)
+
+
+def file_target(relative_path: str) -> str:
+    """
+    Build the request target of the /file upload for a relative path
+    
+    Args:
+        relative_path: Relative path on the SD card
+        
+    Returns:
+        Path and query part of the upload URL
+    """
+    return '/file?path=' + quote(relative_path, safe='/')
+
+
+def upload_file(session: requests.Session, base_url: str, file_path: str, relative_path: str,
+                file_size: int, data: Optional[bytes] = None, compress: bool = False) -> bool:
     """
     Upload a single file
     
+    Unless the content was already read by the caller, the file body is
+    streamed from disk instead of being read into memory first, so peak
+    memory does not depend on file size.
+    
     Args:
+        session: HTTP session shared between uploads
         base_url: Base URL of the server
         file_path: Path to the file to upload
         relative_path: Relative path on the SD card
+        file_size: Size of the file in bytes
+        data: Prefetched file content (optional, file is streamed if None)
+        compress: Send gzip-compressed body (requires firmware support)
         
     Returns:
         True if successful, False otherwise
     """
     try:
-        with open(file_path, 'rb') as f:
-            data = f.read()
+        url = file_url(base_url, relative_path)
+        headers = {}
         
-        params = {'path': relative_path}
-        url = f"{base_url}/file?{urlencode(params)}"
+        if compress:
+            compressed = gzip_payload(file_path, data)
+            if compressed is not None:
+                data = compressed
+                headers['Content-Encoding'] = 'gzip'
         
-        response = requests.post(url, data=data, timeout=30)
+        if data is not None:
+            response = session.post(url, data=data, headers=headers, timeout=30)
+        else:
+            # Server reads exactly Content-Length bytes, so never fall back to chunked encoding
+            headers['Content-Length'] = str(file_size)
+            
+            with open(file_path, 'rb') as f:
+                response = session.post(url, data=f, headers=headers, timeout=30)
         
+        # 200 is only sent after the data is written, so the JSON body is parsed on errors only
         if response.status_code == 200:
-            result = response.json()
-            if result.get('status') == 'ok':
+            return True
+        
+        print(format_http_error(response.status_code, response.content))
+        return False
+            
+    except Exception as e:
+        print(f"✗ Upload failed: {e}")
+        return False
+
+
+def fetch_remote_manifest(session: requests.Session, base_url: str) -> dict:
+    """
+    Fetch the list of files already present on the SD card
+    
+    Args:
+        session: HTTP session shared between uploads
+        base_url: Base URL of the server
+        
+    Returns:
+        Dictionary {relative_path: {'size': int, 'sha1': str, 'blake3': str}},
+        empty if the server does not publish a manifest
+    """
+    try:
+        response = session.get(f"{base_url}/manifest", timeout=10)
+        if response.status_code == 200:
+            return response.json()
+    except Exception as e:
+        print(f"⚠ Could not fetch device manifest: {e}")
+    
+    return {}
+
+
+def compute_digest(file_path: str, file_size: int, algorithm: str = 'sha1') -> str:
+    """
+    Compute digest of a file
+    
+    BLAKE3 hashes memory-mapped files using SIMD and multiple threads.
+    SHA-1 uses hashlib.file_digest, which loops over the file in C.
+    
+    Args:
+        file_path: Path to the file
+        file_size: Size of the file in bytes
+        algorithm: 'blake3' (requires blake3 package) or 'sha1'
+        
+    Returns:
+        Hex digest of the file content
+    """
+    if algorithm == 'blake3':
+        if file_size < HASH_MMAP_MIN_BYTES:
+            return blake3(read_file(file_path)).hexdigest()
+        
+        with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return blake3(mapped, max_threads=blake3.AUTO).hexdigest()
+    
+    with open(file_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, algorithm).hexdigest()
+        
+        if file_size < HASH_MMAP_MIN_BYTES:
+            return hashlib.new(algorithm, f.read()).hexdigest()
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.new(algorithm, mapped).hexdigest()
+
+
+def filter_unchanged_files(files: List[FileEntry], remote_manifest: dict,
+                           cache_file: Path = HASH_CACHE_FILE) -> List[FileEntry]:
+    """
+    Drop files whose content on the device already matches the local copy
+    
+    Local hashes are cached by (mtime, size) so untouched files are not
+    rehashed on every run. BLAKE3 is used when the blake3 package is
+    installed and the device publishes BLAKE3 digests, SHA-1 otherwise.
+    
+    Args:
+        files: List of (file_path, relative_path, file_size) tuples
+        remote_manifest: Manifest returned by fetch_remote_manifest
+        cache_file: Path of the local hash cache
+        
+    Returns:
+        List of files that need to be uploaded
+    """
+    try:
+        cache = json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        cache = {}
+    
+    changed = []
+    
+    for entry in files:
+        file_path, relative_path, file_size = entry
+        remote = remote_manifest.get(relative_path)
+        
+        if not remote or remote.get('size') != file_size:
+            changed.append(entry)
+            continue
+        
+        algorithm = 'blake3' if BLAKE3_AVAILABLE and 'blake3' in remote else 'sha1'
+        
+        key = file_path
+        mtime_ns = os.stat(file_path).st_mtime_ns
+        cached = cache.get(key)
+        
+        if not cached or cached['mtime_ns'] != mtime_ns or cached['size'] != file_size:
+            cached = cache[key] = {'mtime_ns': mtime_ns, 'size': file_size}
+        
+        if algorithm not in cached:
+            cached[algorithm] = compute_digest(file_path, file_size, algorithm)
+        
+        if remote.get(algorithm) != cached[algorithm]:
+            changed.append(entry)
+    
+    try:
+        cache_file.write_text(json.dumps(cache))
+    except OSError as e:
+        print(f"⚠ Could not save hash cache: {e}")
+    
+    return changed
+
+
+def _send_file_request(sock: socket.socket, host: str, file_path: str, relative_path: str,
+                       file_size: int) -> None:
+    """
+    Write one keep-alive POST /file request with its body on an open socket
+    
+    Args:
+        sock: Connected socket
+        host: Host name for the Host header
+        file_path: Path to the file to upload
+        relative_path: Relative path on the SD card
+        file_size: Size of the file in bytes
+    """
+    request_head = (
+        f"POST {file_target(relative_path)} HTTP/1.1\r\n"
+        f"Host: {host}\r\n"
+        f"Content-Length: {file_size}\r\n"
+        f"Connection: keep-alive\r\n"
+        f"\r\n"
+    )
+    sock.sendall(request_head.encode())
+    
+    # socket.sendfile() uses os.sendfile() where available and falls back to send() elsewhere
+    with open(file_path, 'rb') as f:
+        sock.sendfile(f, 0, file_size)
+
+
+def _sendfile_post(sock: socket.socket, host: str, file_path: str, relative_path: str,
+                   file_size: int) -> Tuple[http.client.HTTPResponse, bytes]:
+    """
+    Write one POST /file request on an open socket and read the response
+    
+    Args:
+        sock: Connected socket
+        host: Host name for the Host header
+        file_path: Path to the file to upload
+        relative_path: Relative path on the SD card
+        file_size: Size of the file in bytes
+        
+    Returns:
+        Tuple of (response, body)
+    """
+    _send_file_request(sock, host, file_path, relative_path, file_size)
+    
+    response = http.client.HTTPResponse(sock)
+    response.begin()
+    return response, response.read()
+
+
+def upload_file_sendfile(base_url: str, file_path: str, relative_path: str, file_size: int) -> bool:
+    """
+    Upload a single file over a raw keep-alive socket using sendfile
+    
+    The body is copied from the file to the socket by the kernel, without
+    passing through Python buffers. Each worker thread keeps its own
+    connection between files.
+    
+    Args:
+        base_url: Base URL of the server
+        file_path: Path to the file to upload
+        relative_path: Relative path on the SD card
+        file_size: Size of the file in bytes
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    address = urlsplit(base_url)
+    host, port = address.hostname, address.port or 80
+    
+    for attempt in range(2):
+        sock = getattr(_sendfile_connections, 'sock', None)
+        reused = sock is not None
+        
+        try:
+            if sock is None:
+                sock = socket.create_connection((host, port), timeout=30)
+                _sendfile_connections.sock = sock
+            
+            response, body = _sendfile_post(sock, host, file_path, relative_path, file_size)
+            
+            if response.will_close:
+                sock.close()
+                _sendfile_connections.sock = None
+            
+            if response.status == 200:
                 return True
-            else:
-                print(f"✗ Server error: {result.get('message', 'Unknown error')}")
-                return False
-        else:
-            print(f"✗ HTTP error {response.status_code}")
+            
+            print(format_http_error(response.status, body))
             return False
             
+        except (OSError, http.client.HTTPException) as e:
+            if sock is not None:
+                sock.close()
+            _sendfile_connections.sock = None
+            
+            # Server may have dropped an idle keep-alive connection, retry once on a fresh one
+            if reused and attempt == 0:
+                continue
+            
+            print(f"✗ Upload failed: {e}")
+            return False
+    
+    return False
+
+
+def _read_pipelined_response(reader) -> Tuple[int, bool, bytes]:
+    """
+    Read one HTTP response from a buffered socket reader
+    
+    Args:
+        reader: Binary file object returned by socket.makefile()
+        
+    Returns:
+        Tuple of (status code, connection closing flag, body)
+    """
+    status_line = reader.readline(65537)
+    parts = status_line.split(None, 2)
+    if len(parts) < 2 or not parts[0].startswith(b'HTTP/'):
+        raise http.client.BadStatusLine(status_line.decode('latin-1'))
+    
+    headers = http.client.parse_headers(reader)
+    body = reader.read(int(headers.get('Content-Length', 0)))
+    will_close = headers.get('Connection', '').lower() == 'close'
+    
+    return int(parts[1]), will_close, body
+
+
+def upload_files_pipelined(base_url: str,
+                           entries: List[FileEntry]) -> Iterator[Tuple[FileEntry, int, bytes]]:
+    """
+    Upload files as pipelined requests over one keep-alive connection
+    
+    A writer thread sends every request back to back with sendfile while
+    responses are read in order, so no round trip is spent waiting between
+    files. Only used when the server announces support with an
+    X-Pipeline: 1 header. Stops early if the connection breaks or the
+    server closes it; files whose responses were not received are not
+    yielded.
+    
+    Args:
+        base_url: Base URL of the server
+        entries: List of (file_path, relative_path, file_size) tuples
+        
+    Yields:
+        (entry, status, body) tuples in upload order
+    """
+    address = urlsplit(base_url)
+    host, port = address.hostname, address.port or 80
+    
+    try:
+        sock = socket.create_connection((host, port), timeout=30)
+    except OSError as e:
+        print(f"✗ Pipelined connection failed: {e}")
+        return
+    
+    def writer() -> None:
+        try:
+            for entry in entries:
+                _send_file_request(sock, host, *entry)
+        except OSError:
+            # Reader notices the broken connection and stops
+            pass
+    
+    thread = threading.Thread(target=writer, daemon=True)
+    thread.start()
+    
+    try:
+        with sock.makefile('rb') as reader:
+            for entry in entries:
+                try:
+                    status, will_close, body = _read_pipelined_response(reader)
+                except (OSError, http.client.HTTPException) as e:
+                    print(f"⚠ Pipelined connection lost: {e}")
+                    return
+                
+                yield entry, status, body
+                
+                if will_close:
+                    return
+    finally:
+        # Unblocks the writer if it is still sending
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        sock.close()
+        thread.join()
+
+
+def run_uploads_pipelined(session: requests.Session, base_url: str, tasks: List[List[FileEntry]],
+                          workers: int) -> Iterator[Tuple[List[FileEntry], bool]]:
+    """
+    Upload single files pipelined on one connection, everything else normally
+    
+    Bundles, files answered with a server error and files left over when
+    the pipelined connection ends early are uploaded with run_uploads(),
+    which retries them.
+    
+    Args:
+        session: HTTP session shared between uploads
+        base_url: Base URL of the server
+        tasks: List of upload tasks (lists of file entries)
+        workers: Number of parallel uploads for the remaining tasks
+        
+    Yields:
+        (entries, success) tuples as uploads complete
+    """
+    singles = [entries[0] for entries in tasks if len(entries) == 1]
+    remaining = [entries for entries in tasks if len(entries) > 1]
+    
+    answered = 0
+    retry = []
+    for entry, status, body in upload_files_pipelined(base_url, singles):
+        answered += 1
+        if status >= 500:
+            retry.append([entry])
+            continue
+        
+        if status != 200:
+            print(format_http_error(status, body))
+        yield [entry], status == 200
+    
+    retry.extend([entry] for entry in singles[answered:])
+    if retry:
+        print(f"  Uploading remaining {len(retry)} files without pipelining")
+        remaining.extend(retry)
+    
+    if remaining:
+        yield from run_uploads(session, base_url, remaining, workers)
+
+
+def split_into_bundles(files: List[FileEntry],
+                       bundle_bytes: int) -> Tuple[List[FileEntry], List[List[FileEntry]]]:
+    """
+    Group small files into bundles that are uploaded with one request
+    
+    Files are packed in order until the cumulative size of a bundle would
+    exceed bundle_bytes. Files larger than the limit, and bundles that end
+    up holding a single file, are uploaded individually.
+    
+    Args:
+        files: List of (file_path, relative_path, file_size) tuples
+        bundle_bytes: Maximum total size of one bundle (0 disables bundling)
+        
+    Returns:
+        Tuple of (single_files, bundles)
+    """
+    # Zero-byte files would still fit a zero-byte limit, so handle it before packing
+    if bundle_bytes <= 0:
+        return list(files), []
+    
+    singles = []
+    bundles = []
+    current = []
+    current_size = 0
+    
+    for entry in files:
+        file_size = entry[2]
+        if file_size > bundle_bytes:
+            singles.append(entry)
+            continue
+        
+        if current and current_size + file_size > bundle_bytes:
+            bundles.append(current)
+            current = []
+            current_size = 0
+        
+        current.append(entry)
+        current_size += file_size
+    
+    if current:
+        bundles.append(current)
+    
+    # A bundle of one file gains nothing over a plain upload
+    singles.extend(bundle[0] for bundle in bundles if len(bundle) == 1)
+    bundles = [bundle for bundle in bundles if len(bundle) > 1]
+    
+    return singles, bundles
+
+
+def upload_bundle(session: requests.Session, base_url: str,
+                  entries: List[FileEntry]) -> Optional[bool]:
+    """
+    Upload several files in one multipart POST to /files
+    
+    Each part is named file_<index> and carries the relative SD card path
+    as its filename.
+    
+    Args:
+        session: HTTP session shared between uploads
+        base_url: Base URL of the server
+        entries: List of (file_path, relative_path, file_size) tuples
+        
+    Returns:
+        True if successful, False if failed,
+        None if the server does not support bundled uploads
+    """
+    try:
+        with ExitStack() as stack:
+            parts = {
+                f'file_{i}': (relative_path, stack.enter_context(open(file_path, 'rb')), 'application/octet-stream')
+                for i, (file_path, relative_path, _) in enumerate(entries)
+            }
+            response = session.post(f"{base_url}/files", files=parts, timeout=30)
+        
+        if response.status_code == 404:
+            return None
+        
+        # 200 is only sent after the data is written, so the JSON body is parsed on errors only
+        if response.status_code == 200:
+            return True
+        
+        print(format_http_error(response.status_code, response.content))
+        return False
+            
+    except Exception as e:
+        print(f"✗ Bundle upload failed: {e}")
+        return False
+
+
+def upload_entries(session: requests.Session, base_url: str, entries: List[FileEntry],
+                   data: Optional[bytes] = None, compress: bool = False, use_sendfile: bool = False) -> bool:
+    """
+    Upload one file or one bundle of files
+    
+    Args:
+        session: HTTP session shared between uploads
+        base_url: Base URL of the server
+        entries: List of (file_path, relative_path, file_size) tuples
+        data: Prefetched content of a single file (optional)
+        compress: Gzip single-file bodies
+        use_sendfile: Send single files with sendfile over a raw socket (ignored with compress)
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    if len(entries) == 1:
+        if use_sendfile and not compress:
+            return upload_file_sendfile(base_url, *entries[0])
+        return upload_file(session, base_url, *entries[0], data=data, compress=compress)
+    return bool(upload_bundle(session, base_url, entries))
+
+
+def prefetch_files(tasks: List[List[FileEntry]]) -> Iterator[Tuple[List[FileEntry], Optional[bytes]]]:
+    """
+    Read upcoming files on a background thread while the current one uploads
+    
+    A bounded queue keeps at most PREFETCH_QUEUE_SIZE files in memory.
+    Bundles and files larger than PREFETCH_MAX_BYTES are not prefetched
+    and are read by the uploader itself.
+    
+    Args:
+        tasks: List of upload tasks (lists of file entries)
+        
+    Yields:
+        (entries, data) tuples in task order, data is None if not prefetched
+    """
+    prefetched = queue.Queue(maxsize=PREFETCH_QUEUE_SIZE)
+    
+    def reader() -> None:
+        for entries in tasks:
+            data = None
+            if len(entries) == 1 and entries[0][2] <= PREFETCH_MAX_BYTES:
+                try:
+                    data = read_file(entries[0][0])
+                except OSError:
+                    pass  # Uploader reopens the file and reports the error
+            prefetched.put((entries, data))
+        prefetched.put(None)
+    
+    threading.Thread(target=reader, daemon=True).start()
+    
+    while (item := prefetched.get()) is not None:
+        yield item
+
+
+def run_uploads(session: requests.Session, base_url: str, tasks: List[List[FileEntry]],
+                workers: int, compress: bool = False,
+                use_sendfile: bool = False) -> Iterator[Tuple[List[FileEntry], bool]]:
+    """
+    Upload all tasks and yield their results as they finish
+    
+    With a single worker disk reads are overlapped with network sends by
+    prefetching files, otherwise tasks run on a thread pool. Prefetching is
+    skipped for sendfile uploads, which never read files into Python.
+    
+    Args:
+        session: HTTP session shared between uploads
+        base_url: Base URL of the server
+        tasks: List of upload tasks (lists of file entries)
+        workers: Number of parallel uploads
+        compress: Gzip single-file bodies
+        use_sendfile: Send single files with sendfile over a raw socket
+        
+    Yields:
+        (entries, success) tuples in completion order
+    """
+    if workers == 1 and not use_sendfile:
+        for entries, data in prefetch_files(tasks):
+            yield entries, upload_entries(session, base_url, entries, data, compress)
+        return
+    
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = {
+            executor.submit(upload_entries, session, base_url, entries, None, compress, use_sendfile): entries
+            for entries in tasks
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        # On Ctrl+C or early close only in-flight uploads finish, queued ones are dropped
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def upload_entries_async(session: 'aiohttp.ClientSession', base_url: str,
+                               entries: List[FileEntry], semaphore: asyncio.Semaphore,
+                               compress: bool = False) -> bool:
+    """
+    Upload one file or one bundle of files on the event loop
+    
+    Args:
+        session: aiohttp session shared between uploads
+        base_url: Base URL of the server
+        entries: List of (file_path, relative_path, file_size) tuples
+        semaphore: Semaphore limiting the number of requests in flight
+        compress: Gzip single-file bodies
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        async with semaphore:
+            if len(entries) == 1:
+                file_path, relative_path, _ = entries[0]
+                url = file_url(base_url, relative_path)
+                data = read_file(file_path)
+                headers = {}
+                
+                if compress:
+                    compressed = gzip_payload(file_path, data)
+                    if compressed is not None:
+                        data = compressed
+                        headers['Content-Encoding'] = 'gzip'
+            else:
+                url = f"{base_url}/files"
+                headers = {}
+                data = aiohttp.FormData(quote_fields=False)
+                for i, (file_path, relative_path, _) in enumerate(entries):
+                    data.add_field(f'file_{i}', read_file(file_path), filename=relative_path,
+                                   content_type='application/octet-stream')
+            
+            async with session.post(url, data=data, headers=headers) as response:
+                if response.status == 200:
+                    return True
+                
+                print(format_http_error(response.status, await response.read()))
+                return False
+                
     except Exception as e:
         print(f"✗ Upload failed: {e}")
         return False
 
 
+async def run_uploads_async(base_url: str, tasks: List[List[FileEntry]], workers: int,
+                            on_result: Callable[[List[FileEntry], bool], None],
+                            compress: bool = False) -> None:
+    """
+    Upload all tasks concurrently from a single asyncio event loop
+    
+    Args:
+        base_url: Base URL of the server
+        tasks: List of upload tasks (lists of file entries)
+        workers: Maximum number of requests in flight
+        on_result: Called with (entries, success) as each task finishes
+        compress: Gzip single-file bodies
+    """
+    semaphore = asyncio.Semaphore(workers)
+    connector = aiohttp.TCPConnector(limit=workers, force_close=False)
+    timeout = aiohttp.ClientTimeout(total=30)
+    
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        async def upload(entries: List[FileEntry]) -> Tuple[List[FileEntry], bool]:
+            return entries, await upload_entries_async(session, base_url, entries, semaphore, compress)
+        
+        for finished in asyncio.as_completed([upload(entries) for entries in tasks]):
+            on_result(*await finished)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Upload assets to Bobot SD card via WiFi",
@@ -170,6 +1080,8 @@ Examples:
   %(prog)s                          # Auto-discover and upload
   %(prog)s --ip 192.168.1.100       # Upload to specific IP
   %(prog)s --assets custom/path     # Upload from custom directory
+  %(prog)s --async --workers 4      # Upload with aiohttp event loop
+  %(prog)s --force                  # Re-upload files the device already has
         """
     )
     
@@ -193,11 +1105,58 @@ Examples:
         help='Path to assets directory (default: ../assets)'
     )
     
+    parser.add_argument(
+        '--exclude',
+        action='append',
+        default=[],
+        metavar='PATTERN',
+        help='Skip files and directories whose name contains PATTERN (can be repeated)'
+    )
+    
     parser.add_argument(
         '--timeout',
         type=int,
-        default=10,
-        help='Discovery timeout in seconds (default: 10)'
+        default=2,
+        help='Discovery timeout in seconds (default: 2)'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Number of parallel uploads (default: 4)'
+    )
+    
+    parser.add_argument(
+        '--bundle-bytes',
+        type=int,
+        default=256 * 1024,
+        help='Pack small files into multipart uploads of up to this many bytes, 0 disables (default: 262144)'
+    )
+    
+    parser.add_argument(
+        '--async',
+        dest='use_async',
+        action='store_true',
+        help='Upload from an asyncio event loop with aiohttp instead of threads'
+    )
+    
+    parser.add_argument(
+        '--gzip',
+        action='store_true',
+        help='Send file bodies gzip-compressed if the server announces support (X-Gzip: 1)'
+    )
+    
+    parser.add_argument(
+        '--sendfile',
+        action='store_true',
+        help='Send file bodies with zero-copy sendfile over raw keep-alive sockets'
+    )
+    
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Upload all files even if the device already has identical copies'
     )
     
     args = parser.parse_args()
@@ -235,29 +1194,68 @@ Examples:
             print("\nSpecify IP manually with --ip 192.168.4.1")
             return 1
     
+    if args.workers < 1:
+        print("✗ Number of workers must be at least 1")
+        return 1
+    
+    if args.use_async and not AIOHTTP_AVAILABLE:
+        print("Warning: aiohttp not available, uploading with threads instead")
+        print("Install with: pip install aiohttp\n")
+        args.use_async = False
+    
+    if args.sendfile and (args.use_async or args.gzip):
+        print("Warning: --sendfile cannot be combined with --async or --gzip and will be ignored\n")
+        args.sendfile = False
+    
     base_url = f"http://{ip}:{args.port}"
+    session = create_session(args.workers)
     
     # Test connection
     print(f"\nConnecting to {base_url}...")
     try:
-        response = requests.get(f"{base_url}/", timeout=5)
+        response = session.get(f"{base_url}/", timeout=5)
     except Exception as e:
         print(f"✗ Connection failed: {e}")
         print("Please ensure upload mode is active on Bobot")
         return 1
     
+    # Firmware without gzip support would store compressed bytes, so only compress when announced
+    if args.gzip and response.headers.get('X-Gzip') != '1':
+        print("⚠ Server does not decode gzip uploads, sending files uncompressed")
+        args.gzip = False
+    
+    # Firmware that accepts pipelined requests announces it on the root page
+    use_pipeline = response.headers.get('X-Pipeline') == '1' and not (args.use_async or args.gzip)
+    if use_pipeline:
+        print("✓ Server supports pipelined uploads")
+    
     # Get file list
     print("\nScanning assets directory...")
-    files = get_file_list(assets_dir)
+    files = get_file_list(assets_dir, exclude_patterns=args.exclude)
     
     if not files:
         print("✗ No files found to upload")
         return 1
     
-    print(f"✓ Found {len(files)} files to upload")
+    print(f"✓ Found {len(files)} files")
+    
+    # Skip files the device already has (needs firmware that publishes /manifest)
+    all_files = files
+    if not args.force:
+        remote_manifest = fetch_remote_manifest(session, base_url)
+        if remote_manifest:
+            scanned_count = len(files)
+            files = filter_unchanged_files(files, remote_manifest)
+            print(f"✓ {scanned_count - len(files)} files unchanged on device, skipping")
+            
+            if not files:
+                print("\n✓ Device is already up to date")
+                return 0
+    
+    print(f"✓ {len(files)} files to upload")
     
     # Calculate total size
-    total_size = sum(f[0].stat().st_size for f in files)
+    total_size = sum(file_size for _, _, file_size in files)
     print(f"  Total size: {total_size / 1024:.1f} KB")
     
     # Confirm upload
@@ -276,37 +1274,70 @@ Examples:
     try:
         # Send start command
         print("\n[1/3] Initializing upload...")
-        response = requests.post(f"{base_url}/start", timeout=10)
+        keep = len(files) < len(all_files)
+        response = session.post(f"{base_url}/start", params={'keep': 1} if keep else None, timeout=10)
         result = response.json()
         
         if result.get('status') != 'ok':
             print(f"✗ Failed to start upload: {result.get('message')}")
             return 1
         
+        # Firmware that doesn't confirm keep=1 has cleared /assets, so skipped files are gone too
+        if keep and not result.get('keep'):
+            print("⚠ Device cleared /assets, uploading all files")
+            files = all_files
+            total_size = sum(file_size for _, _, file_size in files)
+        
         print("✓ Ready to receive files")
         
         # Upload files
-        print(f"\n[2/3] Uploading {len(files)} files...")
+        print(f"\n[2/3] Uploading {len(files)} files ({args.workers} parallel)...")
+        # Only failures are printed per file, the rest is shown on one progress line
+        progress_bar = create_progress_bar(total_size)
         uploaded_size = 0
         failed_files = []
         
-        for idx, (file_path, relative_path) in enumerate(files, 1):
-            file_size = file_path.stat().st_size
-            progress = (uploaded_size / total_size) * 100
-            
-            print(f"\n[{idx}/{len(files)}] {relative_path}")
-            print(f"  Progress: {progress:.1f}% | Size: {file_size / 1024:.1f} KB")
-            
-            if upload_file(base_url, file_path, relative_path):
-                print(f"  ✓ Uploaded successfully")
-                uploaded_size += file_size
+        def record_result(entries: List[FileEntry], success: bool) -> None:
+            nonlocal uploaded_size
+            for _, relative_path, file_size in entries:
+                if success:
+                    uploaded_size += file_size
+                else:
+                    progress_bar.write(f"  ✗ Upload failed: {relative_path}")
+                    failed_files.append(relative_path)
+                
+                progress_bar.set_postfix_str(relative_path[-40:])
+                progress_bar.update(file_size)
+        
+        singles, bundles = split_into_bundles(files, args.bundle_bytes)
+        tasks = [[entry] for entry in singles] + bundles
+        
+        # Upload first bundle alone to find out whether firmware supports /files
+        if bundles:
+            success = upload_bundle(session, base_url, bundles[0])
+            if success is None:
+                progress_bar.write("  Server does not support bundled uploads, sending files individually")
+                tasks = [[entry] for entry in files]
             else:
-                print(f"  ✗ Upload failed")
-                failed_files.append(relative_path)
+                record_result(bundles[0], success)
+                tasks.remove(bundles[0])
+        
+        results = []
+        if use_pipeline:
+            results = run_uploads_pipelined(session, base_url, tasks, args.workers)
+        elif args.use_async:
+            # The event loop reports each upload itself as soon as it finishes
+            asyncio.run(run_uploads_async(base_url, tasks, args.workers, record_result, args.gzip))
+        else:
+            results = run_uploads(session, base_url, tasks, args.workers, args.gzip, args.sendfile)
+        
+        for entries, success in results:
+            record_result(entries, success)
+        progress_bar.close()
         
         # Complete upload
         print("\n[3/3] Finalizing upload...")
-        response = requests.post(f"{base_url}/complete", timeout=10)
+        response = session.post(f"{base_url}/complete", timeout=10)
         result = response.json()
         
         if result.get('status') == 'ok':